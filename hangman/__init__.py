@@ -0,0 +1,3 @@
+"""Console Hangman game."""
+
+from .core import main, play_hangman
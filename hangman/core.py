@@ -0,0 +1,444 @@
+"""Hangman game logic: word loading, rendering and the game loop."""
+
+from __future__ import annotations
+
+import mmap
+import random
+import sys
+import os
+import time
+from functools import lru_cache
+from typing import IO
+
+# Cosmetic pauses are off by default so scripted runs go at full speed.
+# Set HANGMAN_ANIMATE=1 to get them back.
+_ANIMATE = os.environ.get("HANGMAN_ANIMATE", "0") == "1"
+
+# Private generator for picking secret words, independent of the global random state
+_RNG = random.Random()
+
+def get_resource_path(relative_path: str) -> str:
+    """
+    Get the absolute path to a resource, works for dev and for PyInstaller.
+    """
+    base_path = getattr(sys, "_MEIPASS", None)
+    if base_path is None:
+        # Use the project root (the parent of this package) as the base in development
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+@lru_cache(maxsize=1)
+def load_words() -> tuple[str, ...]:
+    """
+    Load words from assets/words.txt (or words.txt). Fallback to default list.
+    The result is cached, so replays don't re-read the file. Returns a tuple
+    so callers can't mutate the cached list.
+    """
+    default_words = ("python", "hangman", "computer", "programming", "developer")
+    try:
+        possible_paths = [
+            get_resource_path(os.path.join("assets", "words.txt")),
+            get_resource_path("words.txt"),
+            os.path.join(os.path.dirname(__file__), "..", "..", "assets", "words.txt"),
+        ]
+        for words_path in possible_paths:
+            if words_path and os.path.exists(words_path):
+                if os.path.getsize(words_path) == 0:
+                    # mmap can't map an empty file
+                    continue
+                with open(words_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Decode straight from the mapped pages (no intermediate bytes copy).
+                    text = str(mm, "utf-8")
+                # split() drops surrounding whitespace and blank lines in one pass.
+                # Only plain a-z words are guessable (and hidden by _HIDDEN_TABLE).
+                # Interned so later equality/membership checks can compare by identity.
+                words = [sys.intern(w) for w in text.lower().split() if w.isascii() and w.isalpha()]
+                if words:
+                    return tuple(words)
+        raise FileNotFoundError("words.txt not found in expected locations")
+    except Exception as e:
+        print(f"Warning: Could not load words.txt ({e})")
+        print("Using default word list...")
+        if _ANIMATE:
+            time.sleep(1)
+        return default_words
+
+# Cursor home + erase display
+_CLEAR_SEQ = "\x1b[H\x1b[2J"
+_ansi_supported: bool | None = None
+
+def _enable_ansi() -> bool:
+    """
+    Return True if the console understands ANSI escape sequences.
+    On Windows 10+ this switches on ENABLE_VIRTUAL_TERMINAL_PROCESSING.
+    """
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_ulong()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and \
+                    kernel32.SetConsoleMode(handle, mode.value | 0x4):
+                return True
+        except Exception:
+            pass
+    # Legacy console or non-Windows: trust TERM (set by xterm-likes, mintty, etc.)
+    return os.environ.get("TERM", "dumb") != "dumb"
+
+def ansi_supported() -> bool:
+    """Detect (once) whether screens can be cleared with an escape sequence."""
+    global _ansi_supported
+    if _ansi_supported is None:
+        _ansi_supported = _enable_ansi()
+    return _ansi_supported
+
+def clear_screen() -> None:
+    """
+    Clear the console screen in a cross-platform way.
+    Writes an ANSI escape where supported, so no shell is spawned per frame.
+    """
+    if ansi_supported():
+        write_frame(_CLEAR_SEQ)
+    else:
+        os.system("cls" if os.name == "nt" else "clear")
+
+def letter_bit(letter: str) -> int:
+    """Return the bitmask bit for a single lowercase a-z letter."""
+    return 1 << (ord(letter) - 97)
+
+# str.translate table hiding every letter; play_hangman keeps a copy per game
+# and removes each guessed letter from it, so guessed letters pass through.
+_HIDDEN_TABLE: dict[int, int] = str.maketrans("abcdefghijklmnopqrstuvwxyz", "_" * 26)
+
+def display_game_state(word: str, reveal_table: dict[int, int]) -> str:
+    """
+    Return the current masked word state (e.g. 'p _ t h o n').
+    reveal_table is a copy of _HIDDEN_TABLE minus the guessed letters.
+    """
+    return " ".join(word.translate(reveal_table))
+
+# Gallows art, indexed by remaining guesses (0 = complete hangman).
+# Pure ASCII, so kept as bytes and written without re-encoding each frame.
+_HANGMAN_STAGES = (
+    # 6 incorrect (final)
+    b"""
+           --------
+           |      |
+           |      O
+           |     \\|/
+           |      |
+           |     / \\
+           -
+        """,
+    # 5
+    b"""
+           --------
+           |      |
+           |      O
+           |     \\|/
+           |      |
+           |     /
+           -
+        """,
+    # 4
+    b"""
+           --------
+           |      |
+           |      O
+           |     \\|/
+           |      |
+           |      |
+           -
+        """,
+    # 3
+    b"""
+           --------
+           |      |
+           |      O
+           |     \\|
+           |      |
+           |      |
+           -
+        """,
+    # 2
+    b"""
+           --------
+           |      |
+           |      O
+           |      |
+           |      |
+           |      |
+           -
+        """,
+    # 1
+    b"""
+           --------
+           |      |
+           |      O
+           |
+           |
+           |
+           -
+        """,
+    # 0
+    b"""
+           --------
+           |      |
+           |
+           |
+           |
+           |
+           -
+        """,
+)
+
+def display_hangman(incorrect_guesses: int) -> bytes:
+    """Return the gallows art (bytes) for the given number of incorrect guesses."""
+    # clamp index to [0,6]
+    return _HANGMAN_STAGES[max(0, min(6, 6 - incorrect_guesses))]
+
+_GAME_HEADER = "\n" + "=" * 50 + "\n" + " HANGMAN GAME ".center(50) + "\n" + "=" * 50 + "\n\n"
+_WIN_BANNER = "🎉" * 8
+_LOSE_BANNER = "💀" * 8
+
+def display_game_header() -> str:
+    """Return the game header banner."""
+    return _GAME_HEADER
+
+def _encode(text: str) -> bytes:
+    """Encode text the way sys.stdout would."""
+    return text.encode(getattr(sys.stdout, "encoding", None) or "utf-8",
+                       getattr(sys.stdout, "errors", None) or "strict")
+
+def write_frame(frame: str | bytes | bytearray) -> None:
+    """
+    Write a fully built frame (str or bytes) to stdout with a single write and flush.
+    Bytes go straight to the binary buffer, skipping the text layer's encoder.
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout replaced by a text-only stream (IDE console, StringIO)
+        if not isinstance(frame, str):
+            frame = bytes(frame).decode(getattr(sys.stdout, "encoding", None) or "utf-8")
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        return
+    if isinstance(frame, str):
+        frame = _encode(frame)
+    # Flush text already written through print()/input() so output stays in order
+    sys.stdout.flush()
+    out.write(frame)
+    out.flush()
+
+def display_game_status(secret_word: str, reveal_table: dict[int, int], guessed_mask: int,
+                        incorrect_guesses: int, max_guesses: int, footer: str = "") -> None:
+    """
+    Show the hangman ASCII art, the masked word, guessed letters and remaining guesses.
+    The whole screen (plus an optional footer, e.g. the win message) is built
+    first and written out in one go.
+    """
+    if ansi_supported():
+        # Clear the screen as part of the frame's single write
+        clear_prefix = _CLEAR_SEQ
+    else:
+        clear_screen()
+        clear_prefix = ""
+    # FIXED: call display_game_state (previously called display_game_status recursively)
+    word_state = display_game_state(secret_word, reveal_table)
+    # Walking the 26 mask bits yields the guesses already in a-z order
+    sorted_guesses = [chr(97 + i) for i in range(26) if (guessed_mask >> i) & 1]
+    if sorted_guesses:
+        guessed_line = "Guessed letters: " + ", ".join(sorted_guesses)
+    else:
+        guessed_line = "Guessed letters: None"
+    remaining = max_guesses - incorrect_guesses
+    lines = [
+        "",
+        f"Word: {word_state}\n",
+        guessed_line,
+        f"\nRemaining guesses: {remaining}\n",
+    ]
+    frame = bytearray(_encode(clear_prefix + display_game_header()))
+    frame += display_hangman(incorrect_guesses)
+    frame += _encode("\n" + "\n".join(lines) + "\n" + footer)
+    write_frame(frame)
+
+def display_win_message(word: str, turns_taken: int) -> str:
+    """Return the win message."""
+    return (
+        "\n" + _WIN_BANNER + "\n"
+        "CONGRATULATIONS! YOU WIN!\n"
+        f"The word was: {word}\n"
+        f"You got it in {turns_taken} turns!\n"
+        + _WIN_BANNER + "\n\n"
+    )
+
+def display_lose_message(word: str) -> str:
+    """Return the lose message."""
+    return (
+        "\n" + _LOSE_BANNER + "\n"
+        "GAME OVER - Better luck next time!\n"
+        f"The word was: {word}\n"
+        + _LOSE_BANNER + "\n\n"
+    )
+
+# Single-instance guard to prevent multiple copies from running
+_singleton_handle: IO[str] | None = None
+
+def ensure_single_instance(lock_name: str = "hangman.lock") -> bool:
+    """
+    Take an exclusive, non-blocking OS lock on a file in the temp directory.
+    If the lock is held, another instance is running. Keep the file open so
+    the lock lasts for the lifetime of the process. If the lock file can't be
+    opened at all, the guard is skipped and True is returned.
+    """
+    global _singleton_handle
+    if _singleton_handle:
+        return True
+    # Imported lazily: tempfile pulls in shutil (and bz2/lzma) and is only needed here
+    import tempfile
+    try:
+        # "a" so an instance that loses the race doesn't truncate the lock file
+        f = open(os.path.join(tempfile.gettempdir(), lock_name), "a")
+    except OSError:
+        # Lock file unusable (owned by another user, read-only temp dir, ...):
+        # we can't tell whether another copy is running, so skip the guard.
+        return True
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        # Another instance is running
+        f.close()
+        return False
+    _singleton_handle = f
+    return True
+
+
+_VALID_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+
+def validate_guess(raw_guess: str | None, guessed_mask: int) -> tuple[bool, str]:
+    """
+    Validate the user's guess against the bitmask of letters guessed so far.
+
+    Returns:
+      (False, error_message) on invalid input
+      (True, processed_guess) on success (processed_guess is a single lowercase letter)
+    """
+    guess = raw_guess.strip() if raw_guess else ""
+    # Only lowercase ASCII input: some non-ASCII letters (e.g. the Kelvin sign)
+    # lowercase to a-z and would otherwise slip through the lookup below
+    if guess.isascii():
+        guess = guess.lower()
+    if guess not in _VALID_LETTERS:
+        # Slow path: only reached on bad input, to pick the right message
+        if not guess:
+            return False, "Please enter a letter."
+        if len(guess) != 1:
+            return False, "Please enter a single letter."
+        return False, "Please enter a letter from A-Z."
+    if guessed_mask & letter_bit(guess):
+        return False, f"You already guessed '{guess}'. Try a different letter."
+    return True, guess
+
+
+def play_hangman() -> bool:
+    try:
+        word_list = load_words()
+        secret_word = _RNG.choice(word_list)
+        max_incorrect_guesses = 6
+        incorrect_guesses = 0
+        guessed_mask = 0
+        reveal_table = dict(_HIDDEN_TABLE)
+        secret_letters = frozenset(secret_word)
+        # Distinct letters still hidden; reaching 0 means the word is solved
+        letters_left = len(secret_letters)
+        turns_taken = 0
+
+        display_game_status(secret_word, reveal_table, guessed_mask, incorrect_guesses, max_incorrect_guesses)
+
+        while incorrect_guesses < max_incorrect_guesses:
+            try:
+                raw = input("Enter your guess: ")
+                is_valid, result = validate_guess(raw, guessed_mask)
+                if not is_valid:
+                    # Show the message under the redrawn board instead of pausing before the redraw
+                    display_game_status(secret_word, reveal_table, guessed_mask, incorrect_guesses, max_incorrect_guesses,
+                                        footer=result + "\n\n")
+                    continue
+
+                # Only increment turns for valid guesses
+                turns_taken += 1
+                guess = result  # processed single lowercase letter
+                guessed_mask |= letter_bit(guess)
+                del reveal_table[ord(guess)]
+
+                if guess in secret_letters:
+                    # validate_guess rejects repeats, so every hit is a new letter
+                    letters_left -= 1
+                    if not letters_left:
+                        display_game_status(secret_word, reveal_table, guessed_mask, incorrect_guesses, max_incorrect_guesses,
+                                            footer=display_win_message(secret_word, turns_taken))
+                        return True
+                else:
+                    incorrect_guesses += 1
+
+                display_game_status(secret_word, reveal_table, guessed_mask, incorrect_guesses, max_incorrect_guesses)
+
+            except (KeyboardInterrupt, EOFError):
+                raise
+            except Exception as e:
+                display_game_status(secret_word, reveal_table, guessed_mask, incorrect_guesses, max_incorrect_guesses,
+                                    footer=f"Error processing guess: {e}\n\n")
+
+        write_frame(display_lose_message(secret_word))
+        return False
+
+    except (KeyboardInterrupt, EOFError):
+        # EOFError: stdin was closed (Ctrl-D/Ctrl-Z or piped input ran out)
+        print("\n\nGame interrupted by user.")
+        return False
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}")
+        return False
+
+
+def main() -> None:
+    # Prevent multiple instances from running simultaneously
+    if not ensure_single_instance():
+        print("Another instance of Hangman is already running. Exiting.")
+        if _ANIMATE:
+            time.sleep(2)
+        try:
+            sys.exit(0)
+        except SystemExit:
+            return
+
+    try:
+        while True:
+            play_hangman()
+            print("\nWould you like to play again?")
+            while True:
+                k = input("Enter 'y' for yes or 'n' for no: ").strip().lower()
+                if k in ("y", "yes", "n", "no"):
+                    break
+                print("Please enter 'y' or 'n'")
+            if k not in ("y", "yes"):
+                print("\nThank you for playing Hangman! Goodbye!")
+                break
+            clear_screen()
+    except (KeyboardInterrupt, EOFError):
+        print("\n\nGame interrupted. Thanks for playing!")
+    finally:
+        print("\nPress Enter to exit...")
+        try:
+            input()
+        except Exception:
+            pass